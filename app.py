@@ -1,63 +1,116 @@
 import os
 import io
+import glob
 import time
 import json
+import hashlib
 import pandas as pd
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+from fetch_monthly_revenue import read_groups
+
+try:
+    from numba import njit, prange  # 選配：有裝就用 numba 一次算完 MoM / YoY
+except ImportError:
+    njit = None
+
+# st.fragment（舊版為 st.experimental_fragment）；都沒有就照常整頁重跑
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", lambda f: f)
+
 # ========== 基本設定 ==========
 st.set_page_config(page_title="台股研究網站", layout="wide")
 st.title("威廷的股票網站")
 
-DATA_XLSX = "sector_dashboard.xlsx"  # 可由排程自動更新
+DATA_DIR = "data"                    # 每個族群一個 parquet（排程自動更新）
+DATA_XLSX = "sector_dashboard.xlsx"  # 舊版相容：若沒有 parquet 才讀 Excel
 GROUPS_CSV = "groups.csv"            # 定義族群與個股
 SHEET_NAME_FALLBACK = "連接器"        # 舊版相容：若只有單一工作表
+FINMIND_MAX_WORKERS = 8              # FinMind 同時抓取的執行緒數
+FINMIND_REVENUE_START = datetime(2023, 1, 1).date()  # 月營收起始月份
+MAX_CHART_POINTS = 500               # 每條線最多送到瀏覽器的點數
+# 各來源 concat 前統一的型別；ticker 的 CategoricalDtype 依族群在 get_sector_data 建立
+REVENUE_SCHEMA = {"name": "string", "date": "datetime64[ns]", "revenue": "float64"}
+FINMIND_CACHE_DIR = os.path.join(".cache", "finmind")  # FinMind 回應的磁碟快取
+FINMIND_CACHE_TTL = 24*3600                             # 月營收一個月才更新，快取一天即可
 
 # ========== Helpers ==========
+# version 只當快取 key 用（見 data_version），檔案更新就重讀
 @st.cache_data(show_spinner=False, ttl=24*3600)
-def load_groups(groups_csv: str) -> pd.DataFrame:
-    df = pd.read_csv(groups_csv)
-    # 正規化欄位
-    df.columns = [c.strip().lower() for c in df.columns]
-    required = {"ticker", "name", "sector"}
-    missing = required - set(df.columns)
-    if missing:
-        raise ValueError(f"groups.csv 欄位缺少: {missing}")
-    df["ticker"] = df["ticker"].astype(str).str.strip()
-    df["sector"] = df["sector"].astype(str).str.strip()
-    df["name"]   = df["name"].astype(str).str.strip()
+def load_groups(groups_csv: str, version: str = "") -> pd.DataFrame:
+    df = read_groups(groups_csv)
+    # 族群數量少，用 category 讓篩選比對代碼即可
+    df["sector"] = df["sector"].astype("category")
     return df
 
 @st.cache_data(show_spinner=False, ttl=24*3600)
-def load_excel_dashboard(xlsx_path: str) -> dict:
+def load_excel_dashboard(xlsx_path: str, parquet_dir: str = DATA_DIR, version: str = "") -> dict:
+    # 優先讀 parquet（data/{sector}.parquet）；date 一律用 datetime64，不轉成 Python date
+    parquet_files = sorted(glob.glob(os.path.join(parquet_dir, "*.parquet")))
+    if parquet_files:
+        sheets = {}
+        for p in parquet_files:
+            sector = os.path.splitext(os.path.basename(p))[0]
+            df = pd.read_parquet(p, columns=["ticker","name","date","revenue"])
+            df["date"] = pd.to_datetime(df["date"])  # 舊檔為 date32，新檔已是 datetime64
+            df["ticker"] = df["ticker"].astype("category")
+            sheets[sector] = df
+        return sheets
+
+    # 舊版相容：沒有 parquet 時退回讀 Excel
     if not os.path.exists(xlsx_path):
         return {}
-    xls = pd.ExcelFile(xlsx_path)
+    # pandas 的 openpyxl 讀取本來就是 read_only / data_only 模式
+    xls = pd.ExcelFile(xlsx_path, engine="openpyxl")
+    cols = {"ticker","name","date","revenue"}
     sheets = {}
     for sheet in xls.sheet_names:
-        df = pd.read_excel(xls, sheet_name=sheet)
+        # 只讀需要的欄位；ticker 以字串讀入，避免 3665 變成數字
+        df = pd.read_excel(xls, sheet_name=sheet, usecols=lambda c: c in cols, dtype={"ticker": str})
         # 期待欄位：ticker,name,date,revenue (單位: 千元/萬元請自行統一)
-        if {"ticker","name","date","revenue"}.issubset(set(df.columns)):
-            df["date"] = pd.to_datetime(df["date"]).dt.date
+        if cols.issubset(set(df.columns)):
+            df["date"] = pd.to_datetime(df["date"])
+            df["ticker"] = df["ticker"].astype("category")
             sheets[sheet] = df
     return sheets
 
-@st.cache_data(show_spinner=True, ttl=24*3600)
-def fetch_monthly_revenue_finmind(ticker: str, years: int = 3) -> pd.DataFrame:
+def _finmind_cache_path(**kwargs) -> str:
+    # 以參數的 MD5 當檔名，之後加參數也不會撞名
+    key = hashlib.md5(json.dumps(kwargs, sort_keys=True).encode("utf-8")).hexdigest()
+    return os.path.join(FINMIND_CACHE_DIR, f"{key}.parquet")
+
+def _read_finmind_cache(path: str):
+    if os.path.exists(path) and os.path.getmtime(path) > time.time() - FINMIND_CACHE_TTL:
+        try:
+            return pd.read_parquet(path)
+        except Exception:
+            return None  # 快取壞掉就當沒命中
+    return None
+
+def _write_finmind_cache(path: str, df: pd.DataFrame) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        df.to_parquet(path, compression="zstd", index=False)
+    except Exception:
+        pass  # 寫不進快取不影響主流程
+
+# FinMind DataLoader 只建立/登入一次，所有 session 共用
+@st.cache_resource(show_spinner=False)
+def get_finmind_loader():
     from FinMind.data import DataLoader
     token = os.environ.get("FINMIND_TOKEN")
     dl = DataLoader()
     if token:
         dl.login_by_token(api_token=token)
+    return dl
 
-    start = datetime(2023, 1, 1).date()
-    raw = dl.taiwan_stock_month_revenue(stock_id=str(ticker), start_date=start.isoformat())
+def _normalize_month_revenue(raw: pd.DataFrame) -> pd.DataFrame:
     if raw.empty:
-        return pd.DataFrame(columns=["ticker","name","date","revenue"])
+        return pd.DataFrame(columns=["ticker","name","date","revenue"]).astype({"date": "datetime64[ns]"})
 
     out = raw.rename(columns={
         "stock_id":   "ticker",
@@ -66,13 +119,11 @@ def fetch_monthly_revenue_finmind(ticker: str, years: int = 3) -> pd.DataFrame:
         "date":       "date",
         "stock_name": "name",
     })
-    out["ticker"] = out["ticker"].astype(str)
-    out["date"] = (pd.to_datetime(out["date"]) - pd.offsets.MonthBegin(1)).dt.date
+    out["date"] = pd.to_datetime(out["date"]) - pd.offsets.MonthBegin(1)
 
     # ① 這裡是重點：API 沒帶公司名時，用 groups.csv 裡的 name 來補
-    name_map = groups_df.set_index("ticker")["name"].astype(str).to_dict()
     if "name" not in out.columns or out["name"].isna().all():
-        out["name"] = out["ticker"].map(name_map)
+        out["name"] = out["ticker"].map(TICKER_TO_NAME)
 
     # ② 保證欄位齊全
     need = ["ticker","name","date","revenue"]
@@ -82,17 +133,44 @@ def fetch_monthly_revenue_finmind(ticker: str, years: int = 3) -> pd.DataFrame:
 
     out = out[need].sort_values("date").reset_index(drop=True)
     return out
+
+# 不經 streamlit 快取、不碰 ScriptRunContext，可在 worker thread 執行（只用磁碟快取）
+def _fetch_monthly_revenue(ticker: str, dl) -> pd.DataFrame:
+    start = FINMIND_REVENUE_START
+    cache_path = _finmind_cache_path(ticker=str(ticker), start_date=start.isoformat())
+    raw = _read_finmind_cache(cache_path)
+    if raw is None:
+        raw = dl.taiwan_stock_month_revenue(stock_id=str(ticker), start_date=start.isoformat())
+        _write_finmind_cache(cache_path, raw)
+    return _normalize_month_revenue(raw)
+
+@st.cache_data(show_spinner=True, ttl=24*3600)
+def fetch_month_revenue_batch(tickers: tuple, start_date: str) -> pd.DataFrame:
+    """
+    一次請求抓多檔月營收（FinMind stock_id_list + use_async），每檔都是 start_date 起的完整區間；
+    失敗時回傳空表，由呼叫端改逐檔抓
+    """
+    cache_path = _finmind_cache_path(stock_id_list=sorted(tickers), start_date=start_date)
+    raw = _read_finmind_cache(cache_path)
+    if raw is None:
+        dl = get_finmind_loader()
+        try:
+            raw = dl.taiwan_stock_month_revenue(
+                stock_id_list=list(tickers), start_date=start_date, use_async=True,
+            )
+        except Exception:
+            raw = pd.DataFrame()
+        if raw.empty:
+            return _normalize_month_revenue(raw)  # 失敗不寫磁碟快取
+        _write_finmind_cache(cache_path, raw)
+    return _normalize_month_revenue(raw)
+
 @st.cache_data(show_spinner=True, ttl=24*3600)
 def fetch_ohlc_finmind(ticker: str, start_date: datetime.date = datetime(2023, 1, 1).date()) -> pd.DataFrame:
     """
     從 FinMind 抓日 OHLC (open, high, low, close, volume) 用於 K 線圖
     """
-    from FinMind.data import DataLoader
-    token = os.environ.get("FINMIND_TOKEN")
-    dl = DataLoader()
-    if token:
-        dl.login_by_token(api_token=token)
-
+    dl = get_finmind_loader()
     raw = dl.taiwan_stock_daily(
         stock_id=str(ticker),
         start_date=start_date.isoformat(),
@@ -122,51 +200,138 @@ def fetch_ohlc_finmind(ticker: str, start_date: datetime.date = datetime(2023, 1
 
 
 
+# 資料版本：groups.csv / parquet / Excel 的最新修改時間，檔案更新時快取自然失效
+def data_version() -> str:
+    paths = [GROUPS_CSV, DATA_XLSX, *glob.glob(os.path.join(DATA_DIR, "*.parquet"))]
+    return str(max((os.path.getmtime(p) for p in paths if os.path.exists(p)), default=0))
+
 # 以 Excel → 優先；若無該族群資料 → FinMind 即時抓
+# groups_df / excel_sheets 取自模組層級（同樣以 version 快取），快取 key 只需雜湊 (sector, version) 兩個字串
 @st.cache_data(show_spinner=False, ttl=12*3600)
-def get_sector_data(sector: str, groups: pd.DataFrame, excel_sheets: dict) -> pd.DataFrame:
-    tickers = groups.query("sector == @sector")["ticker"].unique().tolist()
+def get_sector_data(sector: str, version: str) -> pd.DataFrame:
+    tickers = groups_df[groups_df["sector"].eq(sector)]["ticker"].unique().tolist()
+    tickers_set = frozenset(tickers)
     frames = []
     # 1) Excel 匹配該工作表
     if sector in excel_sheets:
-        frames.append(excel_sheets[sector].query("ticker in @tickers"))
+        sheet_df = excel_sheets[sector]
+        frames.append(sheet_df[sheet_df["ticker"].isin(tickers_set)])
     # 2) 舊版相容：若 excel 只有單一工作表（如『連接器』），也嘗試過濾
     elif SHEET_NAME_FALLBACK in excel_sheets:
-        frames.append(excel_sheets[SHEET_NAME_FALLBACK].query("ticker in @tickers"))
+        sheet_df = excel_sheets[SHEET_NAME_FALLBACK]
+        frames.append(sheet_df[sheet_df["ticker"].isin(tickers_set)])
 
     # 3) 不足的股票 → FinMind 即時補
-    have = set(pd.concat(frames)["ticker"]) if frames else set()
-    need = [t for t in tickers if t not in have]
-    for t in need:
-        frames.append(fetch_monthly_revenue_finmind(t))
+    have = set().union(*(f["ticker"].unique() for f in frames))
+    need = sorted(tickers_set - have)  # 排序讓抓取順序固定
+    if need:
+        # 先把缺的股票一次批次抓
+        batch = fetch_month_revenue_batch(tuple(need), FINMIND_REVENUE_START.isoformat())
+        if not batch.empty:
+            frames.append(batch)
+            need = sorted(set(need) - set(batch["ticker"].unique()))
+    if need:
+        # 批次抓不到（或結果缺這幾檔）→ 逐檔抓；網路 I/O 為主，用多執行緒同時抓；ex.map 保持原本順序
+        # worker 沒有 ScriptRunContext：loader 在主執行緒取得，spinner 也只在主執行緒顯示一次
+        dl = get_finmind_loader()
+        with st.spinner(f"從 FinMind 抓取 {len(need)} 檔月營收…"):
+            with ThreadPoolExecutor(max_workers=FINMIND_MAX_WORKERS) as ex:
+                frames.extend(ex.map(lambda t: _fetch_monthly_revenue(t, dl), need))
 
     if not frames:
-        return pd.DataFrame(columns=["ticker","name","date","revenue"]) 
+        return pd.DataFrame(columns=["ticker","name","date","revenue"]).astype({"date": "datetime64[ns]"})
 
+    # 各來源（Excel/FinMind）先統一型別再 concat，ticker 共用同一組 categories 才不會退化成 object
+    schema = {**REVENUE_SCHEMA, "ticker": pd.CategoricalDtype(sorted(tickers_set))}
+    frames = [f.astype(schema) for f in frames]
     df = pd.concat(frames, ignore_index=True).dropna(subset=["date"]).sort_values(["ticker","date"]) 
     return df
 
 # KPI 計算
+if njit is not None:
+    # 資料已依 (ticker, date) 排好，每檔是一段連續區間 [starts[g], ends[g])
+    # 不開 fastmath：營收可能有 NaN，需保留 IEEE 語意
+    @njit(parallel=True, cache=True, error_model="numpy")
+    def _mom_yoy_kernel(r, starts, ends):
+        mom = np.full(r.shape[0], np.nan)
+        yoy = np.full(r.shape[0], np.nan)
+        for g in prange(starts.shape[0]):
+            s, e = starts[g], ends[g]
+            for i in range(s + 1, e):
+                mom[i] = r[i] / r[i-1] - 1
+                if i - s >= 12:
+                    yoy[i] = r[i] / r[i-12] - 1
+        return mom, yoy
+else:
+    _mom_yoy_kernel = None
+
+# 快取 key 用 (sector, version)，不雜湊整個 DataFrame
 @st.cache_data(show_spinner=False, ttl=12*3600)
-def enrich_kpi(df: pd.DataFrame) -> pd.DataFrame:
-    if df.empty:
-        return df
-    df = df.copy()
-    df["date"] = pd.to_datetime(df["date"]) 
-    df = df.sort_values(["ticker","date"]).reset_index(drop=True)
+def enrich_kpi(_df: pd.DataFrame, sector: str, version: str) -> pd.DataFrame:
+    if _df.empty:
+        return _df
+    df = _df.copy()
+    # ticker 轉 category（依 groups.csv 的順序，圖例順序固定），groupby 只比對代碼
+    present = set(df["ticker"].unique())
+    order = [t for t in TICKER_TO_NAME if t in present] + sorted(present - TICKER_TO_NAME.keys())
+    # get_sector_data 給的已是 category（可能含沒資料的 ticker），用 set_categories 重排，不重新包 Categorical
+    df["ticker"] = df["ticker"].astype("category").cat.set_categories(order)
+    # 穩定排序，讓每檔股票的資料連續且依日期遞增
+    df = df.sort_values(["ticker","date"], kind="mergesort").reset_index(drop=True)
     # 計算 MoM / YoY
-    df["revenue_mom"] = df.groupby("ticker")["revenue"].pct_change()
-    df["revenue_yoy"] = df.groupby("ticker")["revenue"].pct_change(12)
+    if _mom_yoy_kernel is not None:
+        codes = df["ticker"].cat.codes.to_numpy()
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.concatenate((bounds, [len(codes)]))
+        revenue = df["revenue"].to_numpy(dtype=np.float64, na_value=np.nan)
+        df["revenue_mom"], df["revenue_yoy"] = _mom_yoy_kernel(revenue, starts, ends)
+    else:
+        # 沒有 numba：共用同一個 groupby
+        g = df.groupby("ticker", sort=False, observed=True)["revenue"]
+        df["revenue_mom"] = g.pct_change(1)
+        df["revenue_yoy"] = g.pct_change(12)
     return df
 
+# 每檔股票最新一筆（一次 groupby 取日期最大者，不必整張排序）
+@st.cache_data(show_spinner=False, ttl=12*3600)
+def latest_per_ticker(_df: pd.DataFrame, sector: str, version: str) -> pd.DataFrame:
+    return _df.loc[_df.groupby("ticker", sort=False, observed=True)["date"].idxmax()]
+
+# 圖表：Plotly figure 序列化很吃 CPU，以 (族群/個股, 資料版本, 筆數, 最新日期) 當快取 key
+# （參數前加底線 = 不讓 streamlit 雜湊整個 DataFrame）
+@st.cache_data(show_spinner=False, ttl=12*3600)
+def _build_sector_fig(_sector_df: pd.DataFrame, sector: str, version: str, n_rows: int, last_date) -> go.Figure:
+    # 序列過長時每檔只畫最近 MAX_CHART_POINTS 點
+    plot_df = _sector_df.groupby("ticker", sort=False, observed=True).tail(MAX_CHART_POINTS)
+    return px.line(
+        plot_df,
+        x="date", y="revenue", color="ticker",
+        hover_data=["name"],
+        category_orders={"ticker": list(plot_df["ticker"].cat.categories)},
+        title=f"{sector} 族群：月營收走勢"
+    )
+
+@st.cache_data(show_spinner=False, ttl=12*3600)
+def _build_stock_figs(_stock_df: pd.DataFrame, ticker: str, name: str, version: str, n_rows: int, last_date) -> tuple:
+    plot_df = _stock_df.tail(MAX_CHART_POINTS)
+    fig1 = px.line(plot_df, x="date", y="revenue", title=f"{ticker} {name} 月營收")
+    fig2 = px.line(plot_df, x="date", y="revenue_yoy", title="YoY (年增率)")
+    fig3 = px.line(plot_df, x="date", y="revenue_mom", title="MoM (月增率)")
+    return fig1, fig2, fig3
+
 # ========== 資料載入 ==========
+version = data_version()
 try:
-    groups_df = load_groups(GROUPS_CSV)
+    groups_df = load_groups(GROUPS_CSV, version)
 except Exception as e:
     st.error(f"讀取 groups.csv 失敗：{e}")
     st.stop()
 
-excel_sheets = load_excel_dashboard(DATA_XLSX)
+# ticker→name 對照只建一次，render 時直接查 dict
+TICKER_TO_NAME = dict(zip(groups_df["ticker"], groups_df["name"]))
+
+excel_sheets = load_excel_dashboard(DATA_XLSX, version=version)
 all_sectors = sorted(groups_df["sector"].unique())
 
 # ========== 側邊欄控制 ==========
@@ -174,28 +339,25 @@ st.sidebar.header("控制台 / Controls")
 sector = st.sidebar.selectbox("選擇族群 (Sector)", options=all_sectors, index=0)
 
 # 讀取該族群資料
-sector_df = get_sector_data(sector, groups_df, excel_sheets)
-sector_df = enrich_kpi(sector_df)
+sector_df = get_sector_data(sector, version)
+sector_df = enrich_kpi(sector_df, sector, version)
 
 # ========== 版面 ==========
-tab1, tab2 = st.tabs(["族群總覽 / Sector Overview", "個股鑽取 / Stock Drilldown"]) 
-
-with tab1:
+# 每個分頁包成 fragment：分頁內的互動只重跑該分頁，不重跑整個資料流程
+@fragment
+def render_overview(sector: str, sector_df: pd.DataFrame, version: str):
     st.subheader(f"📚 族群總覽：{sector}")
     if sector_df.empty:
         st.info("此族群目前沒有資料。請確認 groups.csv 與 Excel/FinMind。")
     else:
-        latest = sector_df.sort_values("date").groupby("ticker").tail(1).copy()
-
-        # 用 groups.csv 準備 ticker→name 對照
-        name_map = groups_df.set_index("ticker")["name"]
+        latest = latest_per_ticker(sector_df, sector, version)
 
         # 只有在沒有 name 欄位，才進行 merge（避免產生 name_x/name_y）
         if "name" not in latest.columns or latest["name"].isna().all():
             latest = latest.merge(groups_df[["ticker","name"]], on="ticker", how="left")
         else:
             # 已有 name 欄位就用 map 補空值，避免 KeyError
-            latest["name"] = latest["name"].fillna(latest["ticker"].map(name_map))
+            latest["name"] = latest["name"].fillna(latest["ticker"].map(TICKER_TO_NAME))
         # 保證要顯示的欄位一定存在（缺的會自動補 NaN，而不會 KeyError）
         show_cols = ["ticker","name","date","revenue","revenue_mom","revenue_yoy"]
         latest = latest.reindex(columns=show_cols)
@@ -210,33 +372,29 @@ with tab1:
             use_container_width=True
         )
         # 各股營收走勢 (疊圖)
-        fig = px.line(
-            sector_df,
-            x="date", y="revenue", color="ticker",
-            hover_data=["name"],
-            title=f"{sector} 族群：月營收走勢"
-        )
+        fig = _build_sector_fig(sector_df, sector, version, len(sector_df), sector_df["date"].max())
         st.plotly_chart(fig, use_container_width=True)
 
-with tab2:
+@fragment
+def render_drilldown(sector: str, sector_df: pd.DataFrame, version: str):
     st.subheader("🔎 個股鑽取 / Stock-level Insights")
     if sector_df.empty:
         st.info("此族群目前沒有資料。")
     else:
         tickers_in_sector = (
-            groups_df.query("sector == @sector")["ticker"].unique().tolist()
+            groups_df[groups_df["sector"].eq(sector)]["ticker"].unique().tolist()
         )
         ticker_name_map = {
-        t: f"{t} {groups_df.set_index('ticker').loc[t, 'name']}"
-        for t in tickers_in_sector
+            t: f"{t} {TICKER_TO_NAME.get(t, '')}"
+            for t in tickers_in_sector
         }
         ticker = st.selectbox(
             "選個股 (Ticker)",
             options=list(ticker_name_map.keys()),
             format_func=lambda x: ticker_name_map[x]
         )
-        name = groups_df.set_index("ticker").loc[ticker, "name"]
-        stock_df = sector_df.query("ticker == @ticker")
+        name = TICKER_TO_NAME[ticker]
+        stock_df = sector_df[sector_df["ticker"].eq(ticker)]
 
         with st.expander("📈 顯示 K 線圖（OHLC）", expanded=True):
             today = datetime.today().date()
@@ -287,13 +445,10 @@ with tab2:
         col1, col2 = st.columns([2,1])
         with col1:
             st.markdown(f"### {ticker} {name}｜月營收 & YoY/MoM")
-            fig1 = px.line(stock_df, x="date", y="revenue", title=f"{ticker} {name} 月營收")
-            st.plotly_chart(fig1, use_container_width=True)
-
             # YoY / MoM 併圖（雙軸不做，避免誤讀；改用兩張圖）
-            fig2 = px.line(stock_df, x="date", y="revenue_yoy", title="YoY (年增率)")
+            fig1, fig2, fig3 = _build_stock_figs(stock_df, ticker, name, version, len(stock_df), stock_df["date"].max())
+            st.plotly_chart(fig1, use_container_width=True)
             st.plotly_chart(fig2, use_container_width=True)
-            fig3 = px.line(stock_df, x="date", y="revenue_mom", title="MoM (月增率)")
             st.plotly_chart(fig3, use_container_width=True)
 
         with col2:
@@ -312,5 +467,13 @@ with tab2:
                 "revenue":"營收",
             }), use_container_width=True)
 
-st.caption("資料來源：FinMind；若提供 sector_dashboard.xlsx，則優先讀取檔案。")
+tab1, tab2 = st.tabs(["族群總覽 / Sector Overview", "個股鑽取 / Stock Drilldown"]) 
+
+with tab1:
+    render_overview(sector, sector_df, version)
+
+with tab2:
+    render_drilldown(sector, sector_df, version)
+
+st.caption("資料來源：FinMind；若提供 data/*.parquet（或舊版 sector_dashboard.xlsx），則優先讀取檔案。")
 
@@ -1,19 +1,48 @@
 import os
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from FinMind.data import DataLoader
 
-def fetch_all(groups_csv: str, years: int = 3) -> dict:
-    df = pd.read_csv(groups_csv)
-    df.columns = [c.strip().lower() for c in df.columns]
+try:
+    import polars as pl  # 選配：有裝就用 polars 解析 CSV，較快
+except ImportError:
+    pl = None
+
+DATA_DIR = "data"  # 每個族群一個 parquet：data/{sector}.parquet
+MAX_WORKERS = 8    # FinMind 同時抓取的執行緒數
+
+def read_groups(groups_csv: str) -> pd.DataFrame:
+    """讀 groups.csv（app.py 也共用）。所有欄位一律當字串讀，00878、00631L 這類代號才不會被轉成數字或解析失敗"""
     required = {"ticker", "name", "sector"}
+    if pl is not None:
+        raw = pl.read_csv(groups_csv, infer_schema=False)
+        raw = raw.rename({c: c.strip().lstrip("\ufeff").lower() for c in raw.columns})
+        missing = required - set(raw.columns)
+        if missing:
+            raise ValueError(f"groups.csv 欄位缺少: {missing}。請把表頭改成 ticker,name,sector")
+        return raw.with_columns([
+            pl.col("ticker").str.strip_chars(),
+            pl.col("sector").str.strip_chars(),
+            pl.col("name").str.strip_chars(),
+        ]).to_pandas(use_pyarrow_extension_array=True)
+
+    df = pd.read_csv(groups_csv, dtype="string[pyarrow]")
+    df.columns = [c.strip().lower() for c in df.columns]
     missing = required - set(df.columns)
     if missing:
         raise ValueError(f"groups.csv 欄位缺少: {missing}。請把表頭改成 ticker,name,sector")
+    df["ticker"] = df["ticker"].str.strip()
+    df["sector"] = df["sector"].str.strip()
+    df["name"]   = df["name"].str.strip()
+    return df
+
+def fetch_all(groups_csv: str, years: int = 3) -> dict:
+    df = read_groups(groups_csv)
 
     # 建 ticker→name 對照，API 沒帶 stock_name 時補用
-    name_map = df.assign(ticker=df["ticker"].astype(str)).set_index("ticker")["name"].astype(str).to_dict()
+    name_map = dict(zip(df["ticker"], df["name"]))
     sectors = sorted(df["sector"].unique())
 
     token = os.environ.get("FINMIND_TOKEN", None)
@@ -21,49 +50,77 @@ def fetch_all(groups_csv: str, years: int = 3) -> dict:
     if token:
         dl.login_by_token(api_token=token)
 
+    # 起始月份只算一次，所有股票共用
+    today = datetime.today().date()
+    start_date = today.replace(day=1, year=today.year - years).isoformat()
+
+    def fetch_one(t: str):
+        sub = dl.taiwan_stock_month_revenue(stock_id=str(t), start_date=start_date)
+        if sub.empty:
+            return None
+
+        # 欄位正規化
+        sub = sub.rename(columns={
+            "stock_id": "ticker",
+            "date": "date",
+            "Revenue": "revenue",
+            "revenue": "revenue",
+            "stock_name": "name",
+        })
+
+        # 補公司名（API 若沒帶）
+        if "name" not in sub.columns or sub["name"].isna().all():
+            sub["name"] = sub["ticker"].map(name_map)
+
+        return sub[["ticker", "name", "date", "revenue"]]
+
     sheets: dict[str, pd.DataFrame] = {}
-    for sector in sectors:
-        frames = []
-        for t in df.query("sector == @sector")["ticker"].astype(str).unique():
-            sub = dl.taiwan_stock_month_revenue(
-                stock_id=t,
-                start_date=(datetime.today().date().replace(day=1).replace(year=datetime.today().year - years)).isoformat()
-            )
-            if sub.empty:
-                continue
-
-            # 欄位正規化
-            sub = sub.rename(columns={
-                "stock_id": "ticker",
-                "date": "date",
-                "Revenue": "revenue",
-                "revenue": "revenue",
-                "stock_name": "name",
-            })
-
-            # 補公司名（API 若沒帶）
-            sub["ticker"] = sub["ticker"].astype(str)
-            if "name" not in sub.columns or sub["name"].isna().all():
-                sub["name"] = sub["ticker"].map(name_map)
-
-            sub = sub[["ticker", "name", "date", "revenue"]]
-            frames.append(sub)
-
-        if frames:
-            out = pd.concat(frames, ignore_index=True)
-            out["date"] = pd.to_datetime(out["date"]).dt.date
-            out = out.sort_values(["ticker", "date"]).reset_index(drop=True)
-            sheets[sector] = out
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        for sector in sectors:
+            tickers = df.query("sector == @sector")["ticker"].unique()
+            # 網路 I/O 為主，多執行緒同時抓；ex.map 保持原本順序
+            frames = [sub for sub in ex.map(fetch_one, tickers) if sub is not None]
+
+            if frames:
+                out = pd.concat(frames, ignore_index=True)
+                out["date"] = pd.to_datetime(out["date"])
+                out = out.sort_values(["ticker", "date"]).reset_index(drop=True)
+                sheets[sector] = out
 
     return sheets
 
 
+def write_excel_streaming(xlsx_path: str, sheets: dict) -> None:
+    """
+    用 xlsxwriter 的 constant_memory 模式逐列寫出，寫完一列就釋放，不把整本活頁簿留在記憶體。
+    constant_memory 只接受由上而下依序寫入，而 df.to_excel 是逐欄輸出，所以這裡自己逐列寫。
+    """
+    import xlsxwriter
+
+    wb = xlsxwriter.Workbook(xlsx_path, {"constant_memory": True, "default_date_format": "yyyy-mm-dd"})
+    try:
+        for sheet, df in sheets.items():
+            ws = wb.add_worksheet(sheet[:31])  # Excel sheet 名稱限 31 字
+            ws.write_row(0, 0, list(df.columns))
+            body = df.astype(object).where(df.notna(), None)  # NaN 寫成空白格
+            for r, row in enumerate(body.itertuples(index=False, name=None), start=1):
+                ws.write_row(r, 0, row)
+    finally:
+        wb.close()
+
+
 if __name__ == "__main__":
     sheets = fetch_all("groups.csv", years=3)
     if not sheets:
         raise SystemExit("No data fetched. Check groups.csv or FinMind token.")
-    with pd.ExcelWriter("sector_dashboard.xlsx", engine="openpyxl") as writer:
-        for sheet, df in sheets.items():
-            df.to_excel(writer, sheet_name=sheet[:31], index=False)  # Excel sheet 名稱限 31 字
+
+    # 每個族群一個 parquet；date 欄維持 datetime64，讀回不必再轉型
+    os.makedirs(DATA_DIR, exist_ok=True)
+    for sector, df in sheets.items():
+        df.to_parquet(os.path.join(DATA_DIR, f"{sector}.parquet"), engine="pyarrow", compression="zstd", index=False)
+    print(f"Updated {DATA_DIR}/*.parquet ✅")
+
+    # 舊版相容：同時保留 Excel
+    write_excel_streaming("sector_dashboard.xlsx", sheets)
     print("Updated sector_dashboard.xlsx ✅")
 